@@ -0,0 +1,16 @@
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="module")
+def client():
+    from kairon.api.app.main import app
+
+    return TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def no_auth_client():
+    from kairon.api.app.main import app
+
+    return TestClient(app)
@@ -1,7 +1,8 @@
 import pytest
 from mongoengine import ValidationError
 
-from kairon.api.models import HttpActionConfigRequest, HttpActionParameters
+from kairon.api.models import HttpActionConfigRequest, HttpActionParameters, ComponentConfig, SynonymRequest, \
+    RegexRequest, LookupTablesRequest
 from kairon.shared.data.data_objects import Slots, SlotMapping
 
 
@@ -96,3 +97,30 @@ class TestBotModels:
         assert not SlotMapping(
             slot='email_id', mapping=[{"type": "from_intent", "value": 'uditpandey@hotmail.com'}]
         ).validate()
+
+    def test_component_config_negative_epochs(self):
+        with pytest.raises(ValueError) as e:
+            ComponentConfig(nlu_epochs=0)
+        assert e.value.errors() == [
+            {'loc': ('nlu_epochs',), 'msg': 'Choose a positive number as epochs', 'type': 'value_error'}]
+        with pytest.raises(ValueError) as e:
+            ComponentConfig(response_epochs=-1, ted_epochs=0)
+        assert e.value.errors() == [
+            {'loc': ('response_epochs',), 'msg': 'Choose a positive number as epochs', 'type': 'value_error'},
+            {'loc': ('ted_epochs',), 'msg': 'Choose a positive number as epochs', 'type': 'value_error'}]
+
+    def test_synonym_request_empty(self):
+        with pytest.raises(ValueError, match=r".*synonym cannot be empty.*"):
+            SynonymRequest(name="", value=["h"])
+
+    def test_regex_request_empty(self):
+        with pytest.raises(ValueError, match=r".*Regex name cannot be empty or a blank space.*"):
+            RegexRequest(name="", pattern="q")
+        with pytest.raises(ValueError, match=r".*Regex pattern cannot be empty or a blank space.*"):
+            RegexRequest(name="b", pattern="")
+
+    def test_lookup_tables_request_empty(self):
+        with pytest.raises(ValueError, match=r".*name cannot be empty or a blank space.*"):
+            LookupTablesRequest(name="", value=["h"])
+        with pytest.raises(ValueError, match=r".*lookup value cannot be empty or a blank space.*"):
+            LookupTablesRequest(name="country", value=['df', ''])